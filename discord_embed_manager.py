@@ -26,11 +26,86 @@ import discord
 from discord import app_commands
 import logging
 import json
+import io
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
 from config import Config
 
+try:
+    import orjson  # Optional fast JSON parser
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional incremental JSON parser for large payloads
+except ImportError:
+    ijson = None
+
 config = Config()
 logger = logging.getLogger(config.bot_name)
 
+# LRU cache of parsed embed specs, keyed by hash of (raw JSON string, max_pages)
+_SPEC_CACHE = OrderedDict()
+_SPEC_CACHE_SIZE = 32
+
+# Payloads larger than this are parsed row by row with ijson (if installed)
+_STREAM_THRESHOLD = 1024 * 1024
+
+# Discord embed character limits
+# (cells are capped with plain slices: s[:cap] returns s itself when it already fits)
+_TITLE_CAP = 256
+_DESC_CAP = 4096
+_AUTHOR_CAP = 256
+_FOOTER_CAP = 2048
+_FIELD_NAME_CAP = 256
+_FIELD_VALUE_CAP = 1024
+_TOTAL_CAP = 6000
+
+# Column layout of the 25 field pairs: (field index, name column, value column)
+_FIELD_COLUMNS = tuple((field_idx, 8 + field_idx * 2, 9 + field_idx * 2) for field_idx in range(25))
+
+# URL schemes accepted by validate_url
+_SCHEMES = ('http://', 'https://')
+
+# Truncation limits for fixed text columns: (name, column index, max chars)
+_FIXED_LIMITS = (
+    ("Title", 0, _TITLE_CAP),
+    ("Description", 1, _DESC_CAP),
+    ("Author", 4, _AUTHOR_CAP),
+    ("Footer", 6, _FOOTER_CAP),
+)
+
+
+class EmbedSpec:
+    """
+    Specification for a single embed tile (one table row)
+    
+    Args:
+        title: Title text
+        description: Description text
+        title_url: Validated URL for title, or None
+        color: Integer color
+        author: Author text, or None
+        author_url: Validated URL for author, or None
+        footer: Footer text
+        hidden: Hidden column data (passed to additional_buttons)
+        fields: List of field dicts with name, value and inline
+    """
+    
+    __slots__ = ('title', 'description', 'title_url', 'color', 'author', 'author_url', 'footer', 'hidden', 'fields')
+    
+    def __init__(self, title, description, title_url, color, author, author_url, footer, hidden, fields):
+        self.title = title
+        self.description = description
+        self.title_url = title_url
+        self.color = color
+        self.author = author
+        self.author_url = author_url
+        self.footer = footer
+        self.hidden = hidden
+        self.fields = fields
+
 
 def parse_json_cell(cell_value):
     """
@@ -44,7 +119,10 @@ def parse_json_cell(cell_value):
         Parsed data structure (list of lists) or None if error
     """
     try:
-        data = json.loads(cell_value)
+        if orjson is not None:
+            data = orjson.loads(cell_value)  # Accepts str or bytes directly
+        else:
+            data = json.loads(cell_value)
         
         # Validate it's a list of lists
         if not isinstance(data, list):
@@ -58,7 +136,7 @@ def parse_json_cell(cell_value):
         
         return data
     
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
         logger.error(f"Failed to parse JSON from cell: {e}")
         logger.error(f"Cell content (first 500 chars): {cell_value[:500]}")
         return None
@@ -67,6 +145,34 @@ def parse_json_cell(cell_value):
         return None
 
 
+def iter_rows(cell_value):
+    """
+    Parse JSON list of lists incrementally, yielding one row at a time
+    
+    Requires ijson. Avoids materializing the whole parsed payload at once.
+    
+    Args:
+        cell_value: String or bytes containing JSON (list of lists)
+        
+    Yields:
+        Each row (list)
+        
+    Raises:
+        ValueError: If data is not a list of lists
+        ijson.JSONError: If JSON is malformed
+    """
+    if isinstance(cell_value, str):
+        cell_value = cell_value.encode()
+    
+    if not cell_value.lstrip().startswith(b"["):
+        raise ValueError("Cell data is not a list")
+    
+    for row in ijson.items(io.BytesIO(cell_value), 'item', use_float=True):
+        if not isinstance(row, list):
+            raise ValueError("Cell data contains non-list row")
+        yield row
+
+
 def validate_url(url, field_name, row_idx):
     """
     Validate that a URL is well-formed and uses http/https scheme
@@ -82,13 +188,17 @@ def validate_url(url, field_name, row_idx):
     if not url:
         return None
     
+    # Fast path: already a clean http(s) URL string
+    if isinstance(url, str) and url.startswith(_SCHEMES) and url == url.strip():
+        return url
+    
     url_str = str(url).strip()
     
     if not url_str:
         return None
     
     # Check if URL starts with http:// or https://
-    if not (url_str.startswith('http://') or url_str.startswith('https://')):
+    if not url_str.startswith(_SCHEMES):
         logger.warning(f"Row {row_idx + 1}: Invalid {field_name} URL '{url_str}' - must start with http:// or https://. Treating as empty.")
         return None
     
@@ -97,7 +207,7 @@ def validate_url(url, field_name, row_idx):
     return url_str
 
 
-def parse_embed_data(data):
+def parse_embed_data(data, max_pages=None):
     """
     Parse table data into Discord Embed specifications
     
@@ -118,160 +228,218 @@ def parse_embed_data(data):
     
     Total embed limit: 6000 characters
     
+    Args:
+        data: List (or any iterable) of rows, e.g. from parse_json_cell or iter_rows
+        max_pages: Optional maximum number of embeds to build; remaining rows
+                   are not read
+    
+    Field names starting with '~' are full-width (inline=False); the prefix
+    is removed. Completely empty field pairs are skipped.
+    
     Returns:
-        List of embed specs (one per row), each row includes hidden data at index 7
+        List of EmbedSpec objects (one per row), each including hidden data from index 7
     """
-    if not data or len(data) == 0:
+    if not data:
         return []
     
     embeds = []
     
+    # Skip formatting truncation messages entirely when INFO logging is off
+    log_info = logger.isEnabledFor(logging.INFO)
+    
     for row_idx, row in enumerate(data):
+        if max_pages and len(embeds) >= max_pages:
+            logger.info(f"Stopped after {max_pages} embeds (max_pages limit)")
+            break
+        
         if len(row) < 8:
             logger.warning(f"Row {row_idx + 1} has fewer than 8 required columns (including Hidden), skipping")
             continue
         
+        # Normalize row once to 58 strings (0-57) so columns can be indexed without guards,
+        # recording each cell's original length alongside it
+        cells = []
+        cell_lens = []
+        for c in row[:58]:
+            cell = "" if c is None else str(c)
+            cells.append(cell)
+            cell_lens.append(len(cell))
+        padding = 58 - len(cells)
+        cells += [""] * padding
+        cell_lens += [0] * padding
+        
         # Extract fixed fields with URL columns
-        title = str(row[0])[:256] if len(row) > 0 else ""
-        description = str(row[1])[:4096] if len(row) > 1 else ""
-        title_url = validate_url(row[2] if len(row) > 2 else None, "TitleURL", row_idx)
+        title = cells[0][:_TITLE_CAP]
+        description = cells[1][:_DESC_CAP]
+        title_url = validate_url(row[2], "TitleURL", row_idx)
         
         try:
-            color = int(row[3]) if len(row) > 3 and row[3] else 0
+            color = int(row[3]) if row[3] else 0
         except (ValueError, TypeError):
             logger.warning(f"Row {row_idx + 1}: Invalid color value '{row[3]}', using 0")
             color = 0
         
-        author = str(row[4])[:256] if len(row) > 4 and row[4] else None
-        author_url = validate_url(row[5] if len(row) > 5 else None, "AuthorURL", row_idx)
-        footer = str(row[6])[:2048] if len(row) > 6 else ""
-        hidden = str(row[7]) if len(row) > 7 else ""  # Hidden data for custom buttons
-        
-        # Log truncations
-        if len(row) > 0 and len(str(row[0])) > 256:
-            logger.info(f"Row {row_idx + 1}: Title truncated from {len(str(row[0]))} to 256 chars")
-        if len(row) > 1 and len(str(row[1])) > 4096:
-            logger.info(f"Row {row_idx + 1}: Description truncated from {len(str(row[1]))} to 4096 chars")
-        if len(row) > 4 and len(str(row[4])) > 256:
-            logger.info(f"Row {row_idx + 1}: Author truncated from {len(str(row[4]))} to 256 chars")
-        if len(row) > 6 and len(str(row[6])) > 2048:
-            logger.info(f"Row {row_idx + 1}: Footer truncated from {len(str(row[6]))} to 2048 chars")
+        author = cells[4][:_AUTHOR_CAP] or None
+        author_url = validate_url(row[5], "AuthorURL", row_idx)
+        footer = cells[6][:_FOOTER_CAP]
+        hidden = cells[7]  # Hidden data for custom buttons
         
         # Extract fields (up to 25 pairs, starting at index 8 - after Hidden column)
-        fields = []
-        total_chars = len(title) + len(description) + len(footer)
+        base_chars = len(title) + len(description) + len(footer)
         if author:
-            total_chars += len(author)
+            base_chars += len(author)
         
-        for field_idx in range(25):
-            name_idx = 8 + (field_idx * 2)
-            value_idx = 9 + (field_idx * 2)
-            
-            if name_idx >= len(row):
-                break
-            
-            # Check if all remaining fields are empty
-            all_remaining_empty = True
-            for check_idx in range(name_idx, min(len(row), 58)):  # Changed from 57 to 58
-                if row[check_idx]:
-                    all_remaining_empty = False
-                    break
-            
-            if all_remaining_empty:
+        # Find last non-empty field column once, instead of rescanning per field
+        last_nonempty_idx = 7
+        for i in range(57, 7, -1):
+            if cells[i]:
+                last_nonempty_idx = i
                 break
+        
+        # Walk only the field pairs up to the last non-empty column
+        field_count = (last_nonempty_idx - 6) // 2
+        pairs = [
+            (cells[name_idx][:_FIELD_NAME_CAP], cells[value_idx][:_FIELD_VALUE_CAP])
+            for _, name_idx, value_idx in _FIELD_COLUMNS[:field_count]
+        ]
+        
+        # Check 6000 character limit: keep fields while the running total fits
+        prefix = list(accumulate(len(name) + len(value) for name, value in pairs))
+        cut = bisect_right(prefix, _TOTAL_CAP - base_chars)
+        
+        # Log truncations as one message per row
+        # (fixed columns, kept fields, and the field that hit the limit)
+        if log_info:
+            truncations = []
+            for name, i, limit in _FIXED_LIMITS:
+                if cell_lens[i] > limit:
+                    truncations.append(f"{name} {cell_lens[i]}->{limit}")
+            for field_idx, name_idx, value_idx in _FIELD_COLUMNS[:min(cut + 1, field_count)]:
+                if cell_lens[name_idx] > _FIELD_NAME_CAP:
+                    truncations.append(f"Field {field_idx + 1} name {cell_lens[name_idx]}->{_FIELD_NAME_CAP}")
+                if cell_lens[value_idx] > _FIELD_VALUE_CAP:
+                    truncations.append(f"Field {field_idx + 1} value {cell_lens[value_idx]}->{_FIELD_VALUE_CAP}")
+            if truncations:
+                logger.info(f"Row {row_idx + 1} truncations (chars): {'; '.join(truncations)}")
+        
+        if cut < field_count:
+            logger.error(f"Row {row_idx + 1}: Embed truncated at field {cut + 1} due to {_TOTAL_CAP} character limit")
+        
+        fields = []
+        for name, value in pairs[:cut]:
+            # Skip completely empty field pairs
+            if not name and not value:
+                continue
             
-            name = str(row[name_idx]) if name_idx < len(row) else ""
-            value = str(row[value_idx]) if value_idx < len(row) else ""
-            
-            # Truncate field name and value
-            original_name_len = len(name)
-            original_value_len = len(value)
-            name = name[:256]
-            value = value[:1024]
-            
-            if original_name_len > 256:
-                logger.info(f"Row {row_idx + 1}, Field {field_idx + 1}: Name truncated from {original_name_len} to 256 chars")
-            if original_value_len > 1024:
-                logger.info(f"Row {row_idx + 1}, Field {field_idx + 1}: Value truncated from {original_value_len} to 1024 chars")
-            
-            # Check 6000 character limit
-            field_chars = len(name) + len(value)
-            if total_chars + field_chars > 6000:
-                logger.error(f"Row {row_idx + 1}: Embed truncated at field {field_idx + 1} due to 6000 character limit")
-                break
+            # Field names starting with ~ are displayed full-width (inline=False)
+            inline = True
+            if name.startswith("~"):
+                inline = False
+                name = name[1:]  # Remove the ~ prefix
             
-            total_chars += field_chars
-            fields.append({"name": name, "value": value})
-        
-        embeds.append({
-            "title": title,
-            "description": description,
-            "title_url": title_url,
-            "color": color,
-            "author": author,
-            "author_url": author_url,
-            "footer": footer,
-            "hidden": hidden,  # Hidden data for custom buttons
-            "fields": fields
-        })
+            fields.append({"name": name, "value": value, "inline": inline})
+        
+        embeds.append(EmbedSpec(
+            title=title,
+            description=description,
+            title_url=title_url,
+            color=color,
+            author=author,
+            author_url=author_url,
+            footer=footer,
+            hidden=hidden,  # Hidden data for custom buttons
+            fields=fields
+        ))
     
     return embeds
 
 
+def load_embeds_spec(json_string, max_pages=None):
+    """
+    Parse JSON string into embed specifications, reusing cached results
+    
+    Unchanged payloads (e.g. refreshing a sheet that hasn't changed) are
+    served from an LRU cache instead of being parsed again. Large payloads
+    are streamed row by row when ijson is installed.
+    
+    Args:
+        json_string: JSON string (list of lists)
+        max_pages: Optional maximum number of embeds to build
+        
+    Returns:
+        List of embed specs (may be empty), or None if JSON is invalid
+    """
+    key = hash((json_string, max_pages))
+    embeds_spec = _SPEC_CACHE.get(key)
+    if embeds_spec is not None:
+        _SPEC_CACHE.move_to_end(key)
+        return embeds_spec
+    
+    if ijson is not None and len(json_string) > _STREAM_THRESHOLD:
+        try:
+            embeds_spec = parse_embed_data(iter_rows(json_string), max_pages)
+        except (ijson.JSONError, ValueError) as e:
+            logger.error(f"Failed to parse JSON from cell: {e}")
+            return None
+    else:
+        data = parse_json_cell(json_string)
+        if not data:
+            return None
+        
+        embeds_spec = parse_embed_data(data, max_pages)
+    
+    _SPEC_CACHE[key] = embeds_spec
+    if len(_SPEC_CACHE) > _SPEC_CACHE_SIZE:
+        _SPEC_CACHE.popitem(last=False)
+    
+    return embeds_spec
+
+
 def create_discord_embed(embed_spec):
     """
     Create Discord Embed from specification
     
     Args:
-        embed_spec: Dict with title, description, title_url, color, author, 
+        embed_spec: EmbedSpec with title, description, title_url, color, author,
                    author_url, footer, fields
         
     Returns:
         discord.Embed object
         
     Notes:
-        - Field names starting with '~' are displayed full-width (inline=False)
-        - The '~' prefix is removed from the displayed name
+        - Fields are rendered as parsed; '~' full-width handling and empty-pair
+          skipping are done in parse_embed_data
     """
     embed = discord.Embed(
-        title=embed_spec["title"] or None,
-        description=embed_spec["description"] or None,
-        url=embed_spec["title_url"],  # URL for title
-        color=embed_spec["color"]
+        title=embed_spec.title or None,
+        description=embed_spec.description or None,
+        url=embed_spec.title_url,  # URL for title
+        color=embed_spec.color
     )
     
     # Set author if provided (name or URL)
-    if embed_spec["author"] or embed_spec["author_url"]:
+    if embed_spec.author or embed_spec.author_url:
         embed.set_author(
-            name=embed_spec["author"] or "\u200b",  # Zero-width space if no name
-            url=embed_spec["author_url"]
+            name=embed_spec.author or "\u200b",  # Zero-width space if no name
+            url=embed_spec.author_url
         )
     
     # Set footer if provided (plain text, no Markdown support in Discord)
-    if embed_spec["footer"]:
-        embed.set_footer(text=embed_spec["footer"])
+    if embed_spec.footer:
+        embed.set_footer(text=embed_spec.footer)
     
     # Add fields (Discord renders max 3 per row with inline=True)
-    for field in embed_spec["fields"]:
-        # Skip completely empty field pairs
-        if not field["name"] and not field["value"]:
-            continue
-        
-        field_name = field["name"]
-        field_value = field["value"]
-        
-        # Check if field name starts with ~ (force full-width)
-        if field_name.startswith("~"):
-            inline = False
-            field_name = field_name[1:]  # Remove the ~ prefix
-        else:
-            inline = True
-        
-        embed.add_field(
-            name=field_name or "\u200b",  # Zero-width space for empty names
-            value=field_value or "\u200b",  # Zero-width space for empty values
-            inline=inline
-        )
+    # Built as one list and assigned to Embed._fields (the storage add_field appends to
+    # in discord.py 2.x) rather than calling add_field once per field
+    if embed_spec.fields:
+        embed._fields = [
+            {
+                "inline": field["inline"],
+                "name": field["name"] or "\u200b",  # Zero-width space for empty names
+                "value": field["value"] or "\u200b",  # Zero-width space for empty values
+            }
+            for field in embed_spec.fields
+        ]
     
     return embed
 
@@ -287,9 +455,10 @@ class EmbedNavigationView(discord.ui.View):
         refresh_callback: Optional async function to fetch fresh data
         additional_buttons: Optional function to add custom buttons
                            Called as: additional_buttons(view, hidden_data, user_id)
+        max_pages: Optional maximum number of embeds to build on refresh
     """
     
-    def __init__(self, embeds_spec, current_page, user_id, refresh_callback=None, additional_buttons=None):
+    def __init__(self, embeds_spec, current_page, user_id, refresh_callback=None, additional_buttons=None, max_pages=None):
         super().__init__(timeout=300)  # 5 minute timeout
         self.embeds_spec = embeds_spec
         self.current_page = current_page
@@ -297,15 +466,26 @@ class EmbedNavigationView(discord.ui.View):
         self.user_id = user_id
         self.refresh_callback = refresh_callback
         self.additional_buttons = additional_buttons
+        self.max_pages = max_pages
         self.message = None  # Will be set after sending
+        self._embeds = [None] * self.total_pages  # Built lazily by _get_embed
+        self._build_buttons()
         self.update_buttons()
     
+    def _get_embed(self, page):
+        """Get discord.Embed for a page, building it on first use"""
+        embed = self._embeds[page]
+        if embed is None:
+            embed = create_discord_embed(self.embeds_spec[page])
+            self._embeds[page] = embed
+        return embed
+    
     async def on_timeout(self):
         """Called when view times out after 5 minutes"""
         if self.message:
             try:
-                # Get current embed and update footer
-                embed = create_discord_embed(self.embeds_spec[self.current_page])
+                # Get current embed and update footer (copy so the cached embed is untouched)
+                embed = self._get_embed(self.current_page).copy()
                 
                 # Add timeout message to footer
                 original_footer = embed.footer.text if embed.footer else ""
@@ -318,45 +498,60 @@ class EmbedNavigationView(discord.ui.View):
             except Exception as e:
                 logger.warning(f"Failed to update message on timeout: {e}")
     
+    def _build_buttons(self):
+        """Create navigation and refresh buttons (once per view)"""
+        # Top button (<<)
+        self._top = discord.ui.Button(label="<<", style=discord.ButtonStyle.secondary)
+        self._top.callback = self.goto_top
+        
+        # Previous button (<)
+        self._prev = discord.ui.Button(label="<", style=discord.ButtonStyle.primary)
+        self._prev.callback = self.previous_page
+        
+        # Page indicator (label set in update_buttons)
+        self._page = discord.ui.Button(label="1/1", style=discord.ButtonStyle.secondary, disabled=True)
+        
+        # Next button (>)
+        self._next = discord.ui.Button(label=">", style=discord.ButtonStyle.primary)
+        self._next.callback = self.next_page
+        
+        # Bottom button (>>)
+        self._bottom = discord.ui.Button(label=">>", style=discord.ButtonStyle.secondary)
+        self._bottom.callback = self.goto_bottom
+        
+        # Refresh button (only added if callback provided)
+        self._refresh = discord.ui.Button(label="🔄", style=discord.ButtonStyle.success)
+        self._refresh.callback = self.refresh_data
+        
+        self._nav_shown = None  # Forces initial layout in update_buttons
+    
     def update_buttons(self):
         """Update button states based on current page"""
+        self._top.disabled = self._prev.disabled = (self.current_page == 0)
+        self._next.disabled = self._bottom.disabled = (self.current_page >= self.total_pages - 1)
+        self._page.label = f"{self.current_page + 1}/{self.total_pages}"
+        
+        # Only re-lay out items if the set of buttons can change
+        # (page count crossed 1 after refresh, or custom buttons depend on the page)
+        show_nav = self.total_pages > 1
+        if show_nav == self._nav_shown and not self.additional_buttons:
+            return
+        self._nav_shown = show_nav
+        
         self.clear_items()
         
         # Only add navigation buttons if multiple pages
-        if self.total_pages > 1:
-            # Top button (<<)
-            top_button = discord.ui.Button(label="<<", style=discord.ButtonStyle.secondary, disabled=(self.current_page == 0))
-            top_button.callback = self.goto_top
-            self.add_item(top_button)
-            
-            # Previous button (<)
-            prev_button = discord.ui.Button(label="<", style=discord.ButtonStyle.primary, disabled=(self.current_page == 0))
-            prev_button.callback = self.previous_page
-            self.add_item(prev_button)
-            
-            # Page indicator
-            page_button = discord.ui.Button(label=f"{self.current_page + 1}/{self.total_pages}", style=discord.ButtonStyle.secondary, disabled=True)
-            self.add_item(page_button)
-            
-            # Next button (>)
-            next_button = discord.ui.Button(label=">", style=discord.ButtonStyle.primary, disabled=(self.current_page >= self.total_pages - 1))
-            next_button.callback = self.next_page
-            self.add_item(next_button)
-            
-            # Bottom button (>>)
-            bottom_button = discord.ui.Button(label=">>", style=discord.ButtonStyle.secondary, disabled=(self.current_page >= self.total_pages - 1))
-            bottom_button.callback = self.goto_bottom
-            self.add_item(bottom_button)
+        if show_nav:
+            for button in (self._top, self._prev, self._page, self._next, self._bottom):
+                self.add_item(button)
         
         # Refresh button (only if callback provided)
         if self.refresh_callback:
-            refresh_button = discord.ui.Button(label="🔄", style=discord.ButtonStyle.success)
-            refresh_button.callback = self.refresh_data
-            self.add_item(refresh_button)
+            self.add_item(self._refresh)
         
         # Add custom buttons (if function provided)
         if self.additional_buttons:
-            hidden_data = self.embeds_spec[self.current_page]["hidden"]
+            hidden_data = self.embeds_spec[self.current_page].hidden
             self.additional_buttons(self, hidden_data, self.user_id)
     
     async def goto_top(self, interaction: discord.Interaction):
@@ -366,7 +561,7 @@ class EmbedNavigationView(discord.ui.View):
             return
         
         self.current_page = 0
-        embed = create_discord_embed(self.embeds_spec[self.current_page])
+        embed = self._get_embed(self.current_page)
         self.update_buttons()
         await interaction.response.edit_message(embed=embed, view=self)
     
@@ -378,7 +573,7 @@ class EmbedNavigationView(discord.ui.View):
         
         if self.current_page > 0:
             self.current_page -= 1
-            embed = create_discord_embed(self.embeds_spec[self.current_page])
+            embed = self._get_embed(self.current_page)
             self.update_buttons()
             await interaction.response.edit_message(embed=embed, view=self)
         else:
@@ -392,7 +587,7 @@ class EmbedNavigationView(discord.ui.View):
         
         if self.current_page < self.total_pages - 1:
             self.current_page += 1
-            embed = create_discord_embed(self.embeds_spec[self.current_page])
+            embed = self._get_embed(self.current_page)
             self.update_buttons()
             await interaction.response.edit_message(embed=embed, view=self)
         else:
@@ -405,7 +600,7 @@ class EmbedNavigationView(discord.ui.View):
             return
         
         self.current_page = self.total_pages - 1
-        embed = create_discord_embed(self.embeds_spec[self.current_page])
+        embed = self._get_embed(self.current_page)
         self.update_buttons()
         await interaction.response.edit_message(embed=embed, view=self)
     
@@ -429,14 +624,12 @@ class EmbedNavigationView(discord.ui.View):
                 await interaction.followup.send("❌ Refresh failed: No data returned", ephemeral=True)
                 return
             
-            # Parse new data
-            data = parse_json_cell(json_string)
-            if not data:
+            # Parse new data (cached if unchanged)
+            new_embeds_spec = load_embeds_spec(json_string, self.max_pages)
+            if new_embeds_spec is None:
                 await interaction.followup.send("❌ Refresh failed: Invalid JSON", ephemeral=True)
                 return
             
-            new_embeds_spec = parse_embed_data(data)
-            
             if not new_embeds_spec:
                 embed = discord.Embed(title="No Data", description="Nothing to display", color=discord.Color.orange())
                 await interaction.edit_original_response(embed=embed, view=None)
@@ -445,13 +638,14 @@ class EmbedNavigationView(discord.ui.View):
             # Update data
             self.embeds_spec = new_embeds_spec
             self.total_pages = len(new_embeds_spec)
+            self._embeds = [None] * self.total_pages
             
             # Adjust current page if needed
             if self.current_page >= self.total_pages:
                 self.current_page = self.total_pages - 1
             
             # Format and update
-            embed = create_discord_embed(self.embeds_spec[self.current_page])
+            embed = self._get_embed(self.current_page)
             self.update_buttons()
             
             await interaction.edit_original_response(embed=embed, view=self)
@@ -462,7 +656,7 @@ class EmbedNavigationView(discord.ui.View):
             await interaction.followup.send(f"❌ Refresh failed: {e}", ephemeral=True)
 
 
-async def display_embeds(interaction, json_string=None, refresh_callback=None, additional_buttons=None):
+async def display_embeds(interaction, json_string=None, refresh_callback=None, additional_buttons=None, max_pages=None):
     """
     Display JSON data as interactive Discord embed tiles
     
@@ -472,6 +666,7 @@ async def display_embeds(interaction, json_string=None, refresh_callback=None, a
         refresh_callback: Optional async function that returns fresh JSON string
         additional_buttons: Optional function to add custom buttons to view
                            Called as: additional_buttons(view, hidden_data, user_id)
+        max_pages: Optional maximum number of embed tiles; extra rows are not parsed
         
     The interaction should already be deferred before calling this function.
     
@@ -512,10 +707,10 @@ async def display_embeds(interaction, json_string=None, refresh_callback=None, a
         await interaction.followup.send(embed=embed, ephemeral=True)
         return
     
-    # Parse JSON
-    data = parse_json_cell(json_string)
+    # Parse JSON into embed data (cached if unchanged)
+    embeds_spec = load_embeds_spec(json_string, max_pages)
     
-    if not data:
+    if embeds_spec is None:
         embed = discord.Embed(
             title="Error",
             description="Failed to parse JSON data",
@@ -524,9 +719,6 @@ async def display_embeds(interaction, json_string=None, refresh_callback=None, a
         await interaction.followup.send(embed=embed, ephemeral=True)
         return
     
-    # Parse embed data
-    embeds_spec = parse_embed_data(data)
-    
     if not embeds_spec:
         embed = discord.Embed(
             title="No Data",
@@ -540,12 +732,12 @@ async def display_embeds(interaction, json_string=None, refresh_callback=None, a
     current_page = 0
     total_pages = len(embeds_spec)
     
-    # Create first embed
-    embed = create_discord_embed(embeds_spec[current_page])
-    
     # Always create view - let it decide what buttons to add
     # (navigation buttons only if multiple pages, refresh if callback, custom buttons if function provided)
-    view = EmbedNavigationView(embeds_spec, current_page, interaction.user.id, refresh_callback, additional_buttons)
+    view = EmbedNavigationView(embeds_spec, current_page, interaction.user.id, refresh_callback, additional_buttons, max_pages)
+    
+    # Create first embed (cached in the view for later page flips)
+    embed = view._get_embed(current_page)
     
     # Send message and store reference in view for timeout handler
     message = await interaction.followup.send(embed=embed, view=view, ephemeral=True)
@@ -19,6 +19,8 @@ from discord import app_commands
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 import os
+import time
+import asyncio
 import logging
 from dotenv import load_dotenv
 from discord_embed_manager import display_embeds
@@ -120,28 +122,40 @@ def connect_to_sheets():
 # Global spreadsheet connection
 spreadsheet = connect_to_sheets()
 
+# Cached worksheet handle (resolved on first fetch) and last A1 value
+_worksheet = None
+_cell_cache = (0.0, None)  # (monotonic time read, value)
+CELL_CACHE_TTL = 2  # Seconds to reuse A1 value, coalescing rapid refreshes
+
+# Limit concurrent Google Sheets reads running in worker threads
+_SHEETS_SEM = asyncio.Semaphore(4)
+
 # Setup Discord bot
 intents = discord.Intents.default()
 bot = discord.Client(intents=intents)
 tree = app_commands.CommandTree(bot)
 
 
-async def fetch_sheet_data():
+def _blocking_fetch():
     """
-    Fetch JSON data from Sheet1!A1
+    Read Sheet1!A1 with gspread (blocking - run via asyncio.to_thread)
     
     Returns:
         str: JSON string or None if error
     """
+    global _worksheet, _cell_cache
+    
     try:
-        worksheet = spreadsheet.worksheet("Sheet1")
-        json_string = worksheet.acell('A1').value
+        if _worksheet is None:
+            _worksheet = spreadsheet.worksheet("Sheet1")
+        json_string = _worksheet.acell('A1').value
         
         if not json_string:
             logger.error("Sheet1!A1 is empty")
             return None
         
         logger.info(f"Read {len(json_string)} characters from Sheet1!A1")
+        _cell_cache = (time.monotonic(), json_string)
         return json_string
         
     except gspread.exceptions.WorksheetNotFound:
@@ -149,9 +163,29 @@ async def fetch_sheet_data():
         return None
     except Exception as e:
         logger.error(f"Error reading Sheet1!A1: {e}")
+        _worksheet = None  # Re-resolve next time in case the worksheet changed
         return None
 
 
+async def fetch_sheet_data():
+    """
+    Fetch JSON data from Sheet1!A1
+    
+    Reuses the worksheet handle between calls, and returns the last value
+    if it was read less than CELL_CACHE_TTL seconds ago. The gspread call
+    runs in a worker thread so it doesn't block the event loop.
+    
+    Returns:
+        str: JSON string or None if error
+    """
+    read_time, json_string = _cell_cache
+    if json_string and time.monotonic() - read_time < CELL_CACHE_TTL:
+        return json_string
+    
+    async with _SHEETS_SEM:
+        return await asyncio.to_thread(_blocking_fetch)
+
+
 @tree.command(name="test", description="Test Sheets-to-Discord embed renderer")
 async def test_command(interaction: discord.Interaction):
     """Display data from Sheet1!A1 as interactive embed tiles"""